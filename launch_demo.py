@@ -5,68 +5,162 @@ ERAIF Demo Launcher
 Enhanced demo launcher with AI/ML capabilities and multiple demo modes.
 """
 
-import os
 import sys
 import asyncio
-import subprocess
+import functools
+import importlib
+import inspect
 from pathlib import Path
 
+# Resolve demo paths once at import time; every run_* helper reuses them.
+ROOT = Path(__file__).resolve().parent
+DEMO_DIR = ROOT / "demo"
+EXAMPLES_DIR = DEMO_DIR / "examples"
+DEMO_HTML = DEMO_DIR / "demo.html"
+DEMO_HTML_URL = DEMO_HTML.resolve().as_uri()
+
 # Add paths to system
-sys.path.insert(0, str(Path(__file__).parent))
-sys.path.insert(0, str(Path(__file__).parent / "demo"))
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(DEMO_DIR))
+
+# Run each demo in a separate interpreter instead of in-process.
+# Slower (full interpreter startup per demo) but fully isolated.
+ISOLATE = "--isolate" in sys.argv
+
+# Replace the launcher process with the classic demo instead of
+# spawning a child: skips the fork and this interpreter's teardown,
+# but there is no returning to the menu afterwards.
+EXEC_MODE = "--exec" in sys.argv
+
+
+@functools.lru_cache(maxsize=None)
+def _exists(path):
+    """Cached Path.exists() — the demo tree doesn't change mid-session."""
+    return path.exists()
+
+
+def _to_thread(func, *args):
+    """Run func in the default executor (asyncio.to_thread needs 3.9+,
+    setup.py declares Python 3.8 support). Returns an awaitable future.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, functools.partial(func, *args))
+
+
+async def _run_demo_module(module_name):
+    """Import a demo module and run its main() in-process.
+
+    Modules are cached in sys.modules, so repeat selections skip the
+    import cost entirely. Async mains are awaited directly; sync mains
+    run in a worker thread to keep the event loop responsive.
+    """
+    try:
+        module = importlib.import_module(module_name)
+        main_func = module.main
+        if inspect.iscoroutinefunction(main_func):
+            result = await main_func()
+        else:
+            result = await _to_thread(main_func)
+    except SystemExit as e:
+        # sys.exit() in demo code (some scripts call it at import time)
+        # should end that demo run, not the launcher — mirror the exit
+        # status the old subprocess model reported.
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    return result if result is not None else 0
+
+
+async def _run_script_isolated(script, cwd):
+    """Run a demo script in a fresh interpreter (--isolate fallback).
+
+    Uses asyncio's subprocess support so the event loop stays
+    responsive while the child runs.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, script, cwd=cwd)
+    except FileNotFoundError:
+        print("❌ Python executable not found!")
+        return 1
+
+    rc = await proc.wait()
+    if rc != 0:
+        print(f"❌ Demo failed with exit code: {rc}")
+    return rc
+
+# Banner and menu are static; prebuild them so each render is a single
+# stdout write instead of ~25 individually flushed print calls.
+_BANNER = f"""\
+🚨 ERAIF - Emergency Radiology AI Interoperability Framework
+{'=' * 60}
+🤖 AI-Powered Emergency Response & Medical Imaging Analysis
+🔗 LangGraph Workflows & Intelligent Decision Support
+{'=' * 60}
+
+"""
+
+_MENU = """\
+Select a demo mode:
+
+1. 🤖 AI/ML Demo - Advanced AI-powered emergency analysis
+   • Intelligent triage with machine learning
+   • Medical imaging analysis with deep learning
+   • LangGraph workflow orchestration
+   • Mass casualty incident coordination
+   • Real-time decision support
+
+2. 📊 Classic Demo - Original ERAIF system demonstration
+   • Basic emergency protocols
+   • System interoperability
+   • Data management
+
+3. 🎮 Interactive Web Demo - Browser-based demonstration
+   • Visual interface
+   • Real-time updates
+   • Interactive scenarios
+
+4. 🏥 Hospital to Clinic Transfer Example
+   • Real-world protocol demonstration
+   • HIPAA-compliant data transfer
+   • DICOM imaging study transfer
+   • AI analysis results sharing
+   • Complete audit trail
+
+5. 🔗 FHIR R4 Emergency Transfer Example
+   • HL7 FHIR R4 standard integration
+   • Interoperability with EHR systems
+   • Emergency radiology workflows
+   • AI analysis with FHIR extensions
+   • FHIR resource conversion
+
+0. Exit
+
+"""
 
 def print_banner():
     """Print ERAIF demo banner."""
-    print("🚨 ERAIF - Emergency Radiology AI Interoperability Framework")
-    print("=" * 60)
-    print("🤖 AI-Powered Emergency Response & Medical Imaging Analysis")
-    print("🔗 LangGraph Workflows & Intelligent Decision Support")
-    print("=" * 60)
-    print()
+    sys.stdout.write(_BANNER)
 
 def show_demo_menu():
     """Show available demo options."""
-    print("Select a demo mode:")
-    print()
-    print("1. 🤖 AI/ML Demo - Advanced AI-powered emergency analysis")
-    print("   • Intelligent triage with machine learning")
-    print("   • Medical imaging analysis with deep learning")
-    print("   • LangGraph workflow orchestration")
-    print("   • Mass casualty incident coordination")
-    print("   • Real-time decision support")
-    print()
-    print("2. 📊 Classic Demo - Original ERAIF system demonstration")
-    print("   • Basic emergency protocols")
-    print("   • System interoperability")
-    print("   • Data management")
-    print()
-    print("3. 🎮 Interactive Web Demo - Browser-based demonstration")
-    print("   • Visual interface")
-    print("   • Real-time updates")
-    print("   • Interactive scenarios")
-    print()
-    print("4. 🏥 Hospital to Clinic Transfer Example")
-    print("   • Real-world protocol demonstration")
-    print("   • HIPAA-compliant data transfer")
-    print("   • DICOM imaging study transfer")
-    print("   • AI analysis results sharing")
-    print("   • Complete audit trail")
-    print()
-    print("5. 🔗 FHIR R4 Emergency Transfer Example")
-    print("   • HL7 FHIR R4 standard integration")
-    print("   • Interoperability with EHR systems")
-    print("   • Emergency radiology workflows")
-    print("   • AI analysis with FHIR extensions")
-    print("   • FHIR resource conversion")
-    print()
-    print("0. Exit")
-    print()
+    sys.stdout.write(_MENU)
+
+# Background import of the AI demo, started while the user reads the menu.
+_ai_preload = None
+
+@functools.lru_cache(maxsize=None)
+def _ai_main():
+    """Import the AI demo lazily and cache its entry point."""
+    from demo.scripts.ai_demo import main
+    return main
 
 async def run_ai_demo():
     """Run the AI/ML demo."""
     try:
-        from demo.scripts.ai_demo import main as ai_main
-        await ai_main()
+        if _ai_preload is not None:
+            await _ai_preload
+        await _ai_main()()
     except ImportError as e:
         print(f"❌ Error importing AI demo: {e}")
         print("   Make sure all AI dependencies are installed:")
@@ -74,66 +168,88 @@ async def run_ai_demo():
     except Exception as e:
         print(f"❌ Error running AI demo: {e}")
 
-def run_classic_demo():
+async def run_classic_demo():
     """Run the classic demo."""
-    demo_dir = Path(__file__).parent / "demo"
-
-    if not demo_dir.exists():
+    if not _exists(DEMO_DIR):
         print("❌ Demo directory not found!")
-        print(f"Expected: {demo_dir}")
+        print(f"Expected: {DEMO_DIR}")
         return 1
 
     print("📍 Running classic demo...")
 
+    if EXEC_MODE:
+        import os
+        os.chdir(DEMO_DIR)
+        os.execv(sys.executable, [sys.executable, 'run_demo.py'])
+
+    if ISOLATE:
+        return await _run_script_isolated('run_demo.py', DEMO_DIR)
+
     try:
-        result = subprocess.run([sys.executable, 'run_demo.py'],
-                              cwd=demo_dir, check=True)
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Demo failed with exit code: {e.returncode}")
-        return e.returncode
-    except FileNotFoundError:
-        print("❌ Python executable not found!")
+        return await _run_demo_module("demo.scripts.demo_with_data")
+    except ImportError as e:
+        print(f"❌ Error importing classic demo: {e}")
+        return 1
+    except Exception as e:
+        print(f"❌ Demo failed: {e}")
         return 1
 
-def run_web_demo():
-    """Run the web demo."""
-    demo_html = Path(__file__).parent / "demo" / "demo.html"
+async def _wait_for_interrupt():
+    """Block until Ctrl+C without any periodic wakeups."""
+    import signal
+
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    try:
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+    except NotImplementedError:
+        # Windows: no signal handler support on the event loop; sleep
+        # until the KeyboardInterrupt cancels us.
+        try:
+            await asyncio.sleep(10**9)
+        except asyncio.CancelledError:
+            pass
+        return
 
-    if demo_html.exists():
+    try:
+        await stop.wait()
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
+
+async def run_web_demo():
+    """Run the web demo."""
+    if _exists(DEMO_HTML):
         print("🌐 Opening web demo in your default browser...")
-        print(f"   File: {demo_html}")
+        print(f"   File: {DEMO_HTML}")
         print()
         print("If the browser doesn't open automatically, navigate to:")
-        print(f"   file://{demo_html.absolute()}")
+        print(f"   {DEMO_HTML_URL}")
 
         # Try to open in browser
         import webbrowser
         try:
-            webbrowser.open(f"file://{demo_html.absolute()}")
+            webbrowser.open(DEMO_HTML_URL)
             print("\n✅ Web demo opened successfully!")
             print("   Press Ctrl+C to return to the menu")
 
-            # Keep the script running
+            # Keep the script running until the user interrupts
             try:
-                while True:
-                    import time
-                    time.sleep(1)
+                await _wait_for_interrupt()
             except KeyboardInterrupt:
-                print("\n🔙 Returning to main menu...")
+                pass
+            print("\n🔙 Returning to main menu...")
 
         except Exception as e:
             print(f"❌ Could not open browser: {e}")
     else:
         print("❌ Web demo file not found!")
-        print(f"   Expected location: {demo_html}")
+        print(f"   Expected location: {DEMO_HTML}")
 
-def run_hospital_clinic_example():
+async def run_hospital_clinic_example():
     """Run the hospital to clinic transfer example."""
-    example_dir = Path(__file__).parent / "demo" / "examples"
-    example_file = example_dir / "hospital_to_clinic_transfer.py"
+    example_file = EXAMPLES_DIR / "hospital_to_clinic_transfer.py"
 
-    if not example_file.exists():
+    if not _exists(example_file):
         print("❌ Hospital to clinic example not found!")
         print(f"   Expected: {example_file}")
         return 1
@@ -141,23 +257,23 @@ def run_hospital_clinic_example():
     print("🏥 Running hospital to clinic transfer example...")
     print()
 
+    if ISOLATE:
+        return await _run_script_isolated('hospital_to_clinic_transfer.py', EXAMPLES_DIR)
+
     try:
-        result = subprocess.run([sys.executable, 'hospital_to_clinic_transfer.py'],
-                              cwd=example_dir, check=True)
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Example failed with exit code: {e.returncode}")
-        return e.returncode
-    except FileNotFoundError:
-        print("❌ Python executable not found!")
+        return await _run_demo_module("demo.examples.hospital_to_clinic_transfer")
+    except ImportError as e:
+        print(f"❌ Error importing example: {e}")
+        return 1
+    except Exception as e:
+        print(f"❌ Example failed: {e}")
         return 1
 
 async def run_fhir_example():
     """Run the FHIR R4 emergency transfer example."""
-    example_dir = Path(__file__).parent / "demo" / "examples"
-    example_file = example_dir / "fhir_emergency_transfer.py"
+    example_file = EXAMPLES_DIR / "fhir_emergency_transfer.py"
 
-    if not example_file.exists():
+    if not _exists(example_file):
         print("❌ FHIR emergency transfer example not found!")
         print(f"   Expected: {example_file}")
         return 1
@@ -165,59 +281,128 @@ async def run_fhir_example():
     print("🔗 Running FHIR R4 emergency transfer example...")
     print()
 
+    if ISOLATE:
+        return await _run_script_isolated('fhir_emergency_transfer.py', EXAMPLES_DIR)
+
     try:
-        result = subprocess.run([sys.executable, 'fhir_emergency_transfer.py'],
-                              cwd=example_dir, check=True)
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Example failed with exit code: {e.returncode}")
-        return e.returncode
-    except FileNotFoundError:
-        print("❌ Python executable not found!")
+        return await _run_demo_module("demo.examples.fhir_emergency_transfer")
+    except ImportError as e:
+        print(f"❌ Error importing example: {e}")
+        return 1
+    except Exception as e:
+        print(f"❌ Example failed: {e}")
         return 1
 
+async def _launch_ai_demo():
+    print("🚀 Launching AI/ML Demo...")
+    print("   Loading AI models and LangGraph workflows...")
+    print()
+    await run_ai_demo()
+
+async def _launch_classic_demo():
+    print("🚀 Launching Classic Demo...")
+    print()
+    if await run_classic_demo() != 0:
+        print("❌ Classic demo exited with error")
+
+async def _launch_web_demo():
+    print("🚀 Launching Web Demo...")
+    print()
+    await run_web_demo()
+
+async def _launch_hospital_clinic_example():
+    print("🚀 Launching Hospital to Clinic Transfer Example...")
+    print()
+    if await run_hospital_clinic_example() != 0:
+        print("❌ Example exited with error")
+
+async def _launch_fhir_example():
+    print("🚀 Launching FHIR R4 Emergency Transfer Example...")
+    print()
+    if await run_fhir_example() != 0:
+        print("❌ Example exited with error")
+
+# Menu dispatch table: choice -> handler coroutine.
+HANDLERS = {
+    "1": _launch_ai_demo,
+    "2": _launch_classic_demo,
+    "3": _launch_web_demo,
+    "4": _launch_hospital_clinic_example,
+    "5": _launch_fhir_example,
+}
+
+async def _ainput(prompt):
+    """Read a line of input without blocking the event loop.
+
+    Waits for stdin to become readable on the loop itself (no reader
+    thread, so nothing can wedge interpreter shutdown) and turns SIGINT
+    at the prompt back into a KeyboardInterrupt in the caller, matching
+    what the plain blocking input() did.
+    """
+    import signal
+
+    loop = asyncio.get_running_loop()
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+
+    fd = sys.stdin.fileno()
+    fut = loop.create_future()
+
+    def _on_readable():
+        fut.done() or fut.set_result(None)
+
+    try:
+        loop.add_reader(fd, _on_readable)
+    except NotImplementedError:
+        # Windows proactor loop: no add_reader; fall back to a worker
+        # thread (Ctrl+C there surfaces from asyncio.run instead).
+        return await _to_thread(input, "")
+
+    try:
+        loop.add_signal_handler(signal.SIGINT, fut.cancel)
+        has_handler = True
+    except NotImplementedError:
+        has_handler = False
+
+    try:
+        await fut
+    except asyncio.CancelledError:
+        raise KeyboardInterrupt
+    finally:
+        loop.remove_reader(fd)
+        if has_handler:
+            loop.remove_signal_handler(signal.SIGINT)
+
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line.rstrip("\n")
+
 async def main():
     """Main demo launcher."""
+    global _ai_preload
+
     print_banner()
 
+    # Start importing the heavy AI stack in the background so it overlaps
+    # with the user's think time at the menu. Errors are swallowed here
+    # and only surface if option 1 is actually selected.
+    # Note: quitting while the import is still in flight waits for the
+    # executor thread to finish before the process exits.
+    _ai_preload = _to_thread(importlib.import_module, "demo.scripts.ai_demo")
+    _ai_preload.add_done_callback(lambda t: t.cancelled() or t.exception())
+
     while True:
         show_demo_menu()
 
         try:
-            choice = input("Enter your choice (0-5): ").strip()
+            choice = (await _ainput("Enter your choice (0-5): ")).strip()
             print()
 
-            if choice == "1":
-                print("🚀 Launching AI/ML Demo...")
-                print("   Loading AI models and LangGraph workflows...")
-                print()
-                await run_ai_demo()
-
-            elif choice == "2":
-                print("🚀 Launching Classic Demo...")
-                print()
-                result = run_classic_demo()
-                if result != 0:
-                    print("❌ Classic demo exited with error")
-
-            elif choice == "3":
-                print("🚀 Launching Web Demo...")
-                print()
-                run_web_demo()
-
-            elif choice == "4":
-                print("🚀 Launching Hospital to Clinic Transfer Example...")
-                print()
-                result = run_hospital_clinic_example()
-                if result != 0:
-                    print("❌ Example exited with error")
-
-            elif choice == "5":
-                print("🚀 Launching FHIR R4 Emergency Transfer Example...")
-                print()
-                result = await run_fhir_example()
-                if result != 0:
-                    print("❌ Example exited with error")
+            handler = HANDLERS.get(choice)
+            if handler is not None:
+                await handler()
 
             elif choice == "0":
                 print("👋 Thank you for trying ERAIF!")
@@ -235,7 +420,8 @@ async def main():
 
         print("\n" + "─" * 60 + "\n")
 
-if __name__ == "__main__":
+def main_sync():
+    """Synchronous entry point for the eraif-demo console script."""
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -243,3 +429,6 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"❌ Fatal error: {e}")
         sys.exit(1)
+
+if __name__ == "__main__":
+    main_sync()
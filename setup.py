@@ -5,18 +5,22 @@ ERAIF Setup Script
 Setup script for the Emergency Radiology AI Interoperability Framework.
 """
 
-from setuptools import setup, find_packages
-import os
+from functools import lru_cache
+
+from setuptools import setup
 
 # Read the README file
+@lru_cache(maxsize=None)
 def read_readme():
     with open("README.md", "r", encoding="utf-8") as fh:
         return fh.read()
 
 # Read requirements
+@lru_cache(maxsize=None)
 def read_requirements():
     with open("requirements.txt", "r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+        stripped = (line.strip() for line in fh)
+        return [line for line in stripped if line and not line.startswith("#")]
 
 setup(
     name="eraif",
@@ -32,8 +36,18 @@ setup(
         "Documentation": "https://docs.eraif.org",
         "Source Code": "https://github.com/dshah29/ERAIF",
     },
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    # Kept as a literal list (== find_packages(where="src")) so builds
+    # don't rescan the source tree; update when adding a new package.
+    packages=["ai", "core", "monitoring"],
+    # Ship the repo-root launcher so the eraif-demo entry point resolves.
+    # Packages are mapped individually (not via "": "src") so the root
+    # py_module is picked up from the repo root.
+    py_modules=["launch_demo"],
+    package_dir={
+        "ai": "src/ai",
+        "core": "src/core",
+        "monitoring": "src/monitoring",
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Healthcare Industry",
@@ -70,6 +84,7 @@ setup(
     entry_points={
         "console_scripts": [
             "eraif-server=src.main:main",
+            "eraif-demo=launch_demo:main_sync",
             "eraif-setup=scripts.setup:main",
             "eraif-test-hurricane=tests.simulations.hurricane_scenario:main",
             "eraif-test-mass-casualty=tests.simulations.mass_casualty:main",
@@ -1,15 +1,30 @@
 """
 AI/ML components for ERAIF system.
+
+Submodules pull in heavy ML stacks, so the public names are loaded
+lazily (PEP 562) on first attribute access instead of at import time.
 """
 
-from .pipeline import AIMLPipeline
-from .agents import EmergencyAIAgent
-from .models import MedicalImagingModel
-from .workflows import EmergencyWorkflow
-
-__all__ = [
-    "AIMLPipeline", 
-    "EmergencyAIAgent", 
-    "MedicalImagingModel", 
-    "EmergencyWorkflow"
-]
+import importlib
+
+_lazy = {
+    "AIMLPipeline": "pipeline",
+    "EmergencyAIAgent": "agents",
+    "MedicalImagingModel": "models",
+    "EmergencyWorkflow": "workflows",
+}
+
+__all__ = list(_lazy)
+
+
+def __getattr__(name):
+    if name in _lazy:
+        module = importlib.import_module(f".{_lazy[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))